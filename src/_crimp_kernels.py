@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional
+    HAVE_NUMBA = False
+    prange = range
+
+    def get_num_threads():
+        return 1
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below still run as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, parallel=True)
+def kt_and_scores_kernel(indptr, indices, deg, c_ii, cij, include_self):
+    """
+    Fused k_t + Eq.(4) over a CSR adjacency; same semantics as
+    compute_kt_and_scores. cij[p] is c_ij for the CSR entry (i, indices[p]).
+    """
+    # c_ii == 0 means no cycle neighbors: r_imp = k_t = deg, no scan needed
+    k_t = deg.copy()
+    r = deg.astype(np.float64)
+    in_cycles = np.nonzero(c_ii)[0]
+    self_term = 1.0 if include_self else 0.0
+
+    # Each i only writes k_t[i] and r[i], so nodes split freely across threads
+    for x in prange(len(in_cycles)):
+        i = in_cycles[x]
+        cycle_neighbors = 0
+        s = self_term
+        for p in range(indptr[i], indptr[i + 1]):
+            if cij[p] > 0:
+                cycle_neighbors += 1
+                s += cij[p] / c_ii[indices[p]]
+
+        k_t[i] = deg[i] - cycle_neighbors
+        r[i] = s + float(k_t[i])
+    return k_t, r
+
+
+@njit(cache=True)
+def _squares_rooted_at(u, indptr, indices, is_nbr, cnt, touched, first, mids, out, pos):
+    """
+    Chordless 4-cycles whose smallest node is u, found from the diagonal
+    (u, v): paths u-a-v with a, v > u, v not adjacent to u, and a-b not
+    adjacent for two such midpoints a < b. Each square is seen exactly once.
+
+    Needs sorted CSR indices. is_nbr/cnt/touched/first/mids are per-thread
+    scratch; is_nbr uses u + 1 as a stamp so it never has to be cleared.
+    If out is non-empty, squares are written as sorted rows from out[pos].
+    Returns the number of squares rooted at u.
+    """
+    stamp = u + 1
+    for p in range(indptr[u], indptr[u + 1]):
+        is_nbr[indices[p]] = stamp
+
+    n_touched = 0
+    for p in range(indptr[u], indptr[u + 1]):
+        a = indices[p]
+        if a < u:
+            continue
+        for q in range(indptr[a], indptr[a + 1]):
+            v = indices[q]
+            if v <= u or is_nbr[v] == stamp:
+                continue
+            if cnt[v] == 0:
+                touched[n_touched] = v
+                n_touched += 1
+            cnt[v] += 1
+
+    # Group midpoints by v; sorted rows mean a is visited in ascending order
+    total = 0
+    for t in range(n_touched):
+        v = touched[t]
+        first[v] = total
+        total += cnt[v]
+        cnt[v] = 0
+    for p in range(indptr[u], indptr[u + 1]):
+        a = indices[p]
+        if a < u:
+            continue
+        for q in range(indptr[a], indptr[a + 1]):
+            v = indices[q]
+            if v <= u or is_nbr[v] == stamp:
+                continue
+            mids[first[v] + cnt[v]] = a
+            cnt[v] += 1
+
+    found = 0
+    for t in range(n_touched):
+        v = touched[t]
+        lo = first[v]
+        hi = lo + cnt[v]
+        cnt[v] = 0
+        for x in range(lo, hi):
+            a = mids[x]
+            row = indices[indptr[a]:indptr[a + 1]]
+            for y in range(x + 1, hi):
+                b = mids[y]
+                k = np.searchsorted(row, b)
+                if k < len(row) and row[k] == b:
+                    continue  # a-b chord
+                if out.shape[0] > 0:
+                    out[pos + found, 0] = u
+                    # u < a < b; slot v into its sorted position
+                    if v < a:
+                        out[pos + found, 1] = v
+                        out[pos + found, 2] = a
+                        out[pos + found, 3] = b
+                    elif v < b:
+                        out[pos + found, 1] = a
+                        out[pos + found, 2] = v
+                        out[pos + found, 3] = b
+                    else:
+                        out[pos + found, 1] = a
+                        out[pos + found, 2] = b
+                        out[pos + found, 3] = v
+                found += 1
+    return found
+
+
+@njit(cache=True, parallel=True)
+def squares_kernel(indptr, indices, n_chunks):
+    """
+    All chordless 4-cycles of a CSR adjacency with sorted indices, as an
+    (K, 4) array of sorted rows. Source nodes are strided over one chunk per
+    thread, each with its own scratch; a counting pass sizes the output so
+    the filling pass can write every root's squares at a known offset.
+    """
+    n = len(indptr) - 1
+    counts = np.zeros(n, dtype=np.int64)
+    empty = np.empty((0, 4), dtype=np.int64)
+
+    for c in prange(n_chunks):
+        is_nbr = np.zeros(n, dtype=np.int64)
+        cnt = np.zeros(n, dtype=np.int64)
+        touched = np.empty(n, dtype=np.int64)
+        first = np.empty(n, dtype=np.int64)
+        mids = np.empty(len(indices), dtype=np.int64)
+        for u in range(c, n, n_chunks):
+            counts[u] = _squares_rooted_at(u, indptr, indices, is_nbr, cnt, touched, first, mids, empty, 0)
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for u in range(n):
+        offsets[u + 1] = offsets[u] + counts[u]
+    out = np.empty((offsets[n], 4), dtype=np.int64)
+    if offsets[n] == 0:
+        return out
+
+    for c in prange(n_chunks):
+        is_nbr = np.zeros(n, dtype=np.int64)
+        cnt = np.zeros(n, dtype=np.int64)
+        touched = np.empty(n, dtype=np.int64)
+        first = np.empty(n, dtype=np.int64)
+        mids = np.empty(len(indices), dtype=np.int64)
+        for u in range(c, n, n_chunks):
+            _squares_rooted_at(u, indptr, indices, is_nbr, cnt, touched, first, mids, out, offsets[u])
+    return out
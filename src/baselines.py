@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import networkx as nx
 
+from .crimp import crimp
+
 
 class CycleRatioEngine:
     """
     Baseline Cycle Ratio implementation (as provided by mentor),
     fixed for Python (__init__) and returns a score dict.
+
+    Cycles are restricted to the chordless 3- and 4-cycles shared with CRimp,
+    enumerated once globally rather than per node.
     """
 
     def __init__(self, graph: nx.Graph):
@@ -15,53 +20,29 @@ class CycleRatioEngine:
         self.cycles: set = set()
 
     def run(self) -> dict:
-        for node in self.graph.nodes():
-            neighbors = list(self.graph.neighbors(node))
-            if len(neighbors) < 2:
-                continue
-
-            G_temp = self.graph.copy()
-            G_temp.remove_node(node)
-
-            for i in range(len(neighbors)):
-                for j in range(i + 1, len(neighbors)):
-                    u, v = neighbors[i], neighbors[j]
-
-                    if self.graph.has_edge(u, v):
-                        self.cycles.add(tuple(sorted((node, u, v))))
-                    else:
-                        try:
-                            paths = list(nx.all_shortest_paths(G_temp, source=u, target=v))
-                            for p in paths:
-                                self.cycles.add(tuple(sorted([node] + list(p))))
-                        except nx.NetworkXNoPath:
-                            continue
-
-        cycle_map = {n: [] for n in self.graph.nodes()}
-        for cyc in self.cycles:
-            for n in cyc:
-                cycle_map[n].append(cyc)
-
-        for i in self.graph.nodes():
-            c_ii = len(cycle_map[i])
-            if c_ii == 0:
-                self.CycleRatio[i] = 0.0
-                continue
-
-            shared_counts = {}
-            for cyc in cycle_map[i]:
-                for n in cyc:
-                    shared_counts[n] = shared_counts.get(n, 0) + 1
-
-            score = 0.0
-            for j, c_ij in shared_counts.items():
-                if j == i:
-                    continue
-                c_jj = len(cycle_map[j])
-                if c_jj > 0:
-                    score += (c_ij / c_jj)
-
-            self.CycleRatio[i] = float(score)
+        # Deliberately restricted to chordless 3- and 4-cycles: cycles longer
+        # than 4 and chorded 4-cycles are dropped, so this is the chordless
+        # 3-/4-cycle variant of Cycle Ratio rather than the shortest-cycle
+        # original. They are enumerated once for the whole graph instead of
+        # re-running all_shortest_paths per node-deleted copy.
+        res = crimp(self.graph)
+        for cyc in res.cycles3.tolist() + res.cycles4.tolist():
+            self.cycles.add(tuple(sorted(cyc)))
+
+        c_ii, c_ij = res.c_ii, res.c_ij
+
+        # One preallocated score slot per node: each shared pair (u, v) adds
+        # c_uv/c_vv to u and c_uv/c_uu to v, so no per-node tables are built.
+        nodes = list(self.graph.nodes())
+        idx = {n: k for k, n in enumerate(nodes)}
+        score = [0.0] * len(nodes)
+        for (u, v), count in c_ij.items():
+            score[idx[u]] += count / c_ii[v]
+            score[idx[v]] += count / c_ii[u]
+
+        for k, i in enumerate(nodes):
+            # Nodes in no cycle share no pairs and keep 0.0
+            self.CycleRatio[i] = float(score[k])
 
         return self.CycleRatio
 
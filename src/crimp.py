@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from itertools import combinations
-from typing import Dict, FrozenSet, Iterable, List, Tuple
+from itertools import chain, combinations
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
 
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+from ._crimp_kernels import HAVE_NUMBA, get_num_threads, kt_and_scores_kernel, squares_kernel
 
 
 Pair = Tuple[int, int]  # (min(u,v), max(u,v))
@@ -14,38 +19,256 @@ def _pair(u, v) -> Pair:
     return (u, v) if u < v else (v, u)
 
 
+# Index pairs are packed into one int as (min << 32) | max
+_KEY_MASK = (1 << 32) - 1
+
+
 @dataclass
 class CRimpResult:
     c_ii: Dict[int, int]
     c_ij: Dict[Pair, int]
     k_t: Dict[int, int]
     r_imp: Dict[int, float]
-    cycles3: List[FrozenSet[int]]
-    cycles4: List[FrozenSet[int]]
+    # (K, 3) / (K, 4) node labels, one cycle per row. Rows are sorted and in
+    # lexicographic order by label; if the labels are not mutually
+    # orderable, both orders follow the internal node index instead.
+    cycles3: np.ndarray
+    cycles4: np.ndarray
 
 
-def find_chordless_triangles(G: nx.Graph) -> List[FrozenSet[int]]:
+def _index_graph(G: nx.Graph) -> Tuple[List[Hashable], Dict[Hashable, int], List[List[int]]]:
     """
-    All 3-cycles are chordless by definition.
-    Returns unique triangles as frozensets.
-    """
-    triangles: set[FrozenSet[int]] = set()
-    # Efficient-ish triangle enumeration using neighbor intersections
-    for u in G.nodes():
-        Nu = set(G.neighbors(u))
-        for v in Nu:
-            if v <= u:
+    Relabel nodes to contiguous ints [0, n).
+    Returns (nodes, idx, nbrs) where nodes[idx[v]] == v and nbrs[i] lists
+    the neighbor indices of node i.
+    """
+    nodes = list(G.nodes())
+    idx = {v: i for i, v in enumerate(nodes)}
+    nbrs = [[idx[w] for w in G._adj[v]] for v in nodes]
+    return nodes, idx, nbrs
+
+
+# Below this size the bitset loop beats the sparse-matrix setup cost
+_SPARSE_MIN_NODES = 64
+
+
+def _csr_adjacency(nbrs: List[List[int]]) -> sp.csr_array:
+    """Symmetric 0/1 adjacency matrix over node indices, in CSR form."""
+    n = len(nbrs)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, nbrs), dtype=np.int64, count=n), out=indptr[1:])
+    indices = np.fromiter((v for row in nbrs for v in row), dtype=np.int64, count=indptr[-1])
+    data = np.ones(len(indices), dtype=np.int32)
+    return sp.csr_array((data, indices, indptr), shape=(n, n))
+
+
+def _bitset_adjacency(nbrs: List[List[int]]) -> List[int]:
+    """adj[u] is a Python int with bit v set iff u-v is an edge."""
+    adj = [0] * len(nbrs)
+    for u, row in enumerate(nbrs):
+        mask = 0
+        for v in row:
+            mask |= 1 << v
+        adj[u] = mask
+    return adj
+
+
+def _triangles(nbrs: List[List[int]], A: Optional[sp.csr_array] = None) -> np.ndarray:
+    """
+    Triangles over node indices as a (K, 3) array, one row u < v < w each.
+    A is the CSR adjacency of nbrs, if the caller has already built it.
+    """
+    n = len(nbrs)
+    if n >= _SPARSE_MIN_NODES:
+        return _triangles_csr(A if A is not None else _csr_adjacency(nbrs))
+
+    triangles: List[Tuple[int, int, int]] = []
+    adj = _bitset_adjacency(nbrs)
+    for u, Au in enumerate(adj):
+        # Bit b of `higher` is node u+1+b, so only v > u are visited
+        higher = Au >> (u + 1)
+        while higher:
+            low = higher & -higher
+            higher ^= low
+            v = u + low.bit_length()
+            common = (Au & adj[v]) >> (v + 1)
+            while common:
+                low_w = common & -common
+                common ^= low_w
+                triangles.append((u, v, v + low_w.bit_length()))
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+# Upper bound on the wedges _triangles_csr materializes at once
+_WEDGE_BLOCK = 1 << 22
+
+
+def _triangles_csr(A: sp.csr_array) -> np.ndarray:
+    """
+    Same as _triangles, but done with array ops on the CSR adjacency A.
+
+    Every edge is oriented from the lower to the higher (degree, index)
+    rank, so no node has more than ~sqrt(2m) out-neighbors. Each triangle is
+    then exactly one out-wedge u->v, u->w closed by the edge v->w. Wedges
+    are built a block of rows at a time, at most _WEDGE_BLOCK per block
+    (or one row's worth, if larger).
+    """
+    n = A.shape[0]
+    indptr = A.indptr.astype(np.int64)
+    deg = np.diff(indptr)
+    by_rank = np.lexsort((np.arange(n), deg))
+    rank = np.empty(n, dtype=np.int64)
+    rank[by_rank] = np.arange(n)
+
+    # Oriented edges in rank space; sorting the packed keys sorts each out-row
+    rows = rank[np.repeat(np.arange(n, dtype=np.int64), deg)]
+    cols = rank[A.indices.astype(np.int64)]
+    up = rows < cols
+    keys = np.sort((rows[up] << 32) | cols[up])
+    if len(keys) == 0:
+        return np.empty((0, 3), dtype=np.int64)
+    src = keys >> 32
+    dst = keys & _KEY_MASK
+    out_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=out_ptr[1:])
+    out_deg = np.diff(out_ptr)
+    wedge_end = np.cumsum(out_deg * (out_deg - 1) // 2)
+
+    triangles = []
+    r0 = 0
+    while r0 < n:
+        done = wedge_end[r0 - 1] if r0 else 0
+        r1 = max(int(np.searchsorted(wedge_end, done + _WEDGE_BLOCK, side="right")), r0 + 1)
+        e0, e1 = out_ptr[r0], out_ptr[r1]
+        r0 = r1
+
+        # Pair every out-edge p with each later out-edge q of the same row
+        later = out_ptr[src[e0:e1] + 1] - np.arange(e0, e1) - 1
+        p = np.repeat(np.arange(e0, e1), later)
+        q = p + 1 + np.arange(len(p)) - np.repeat(np.cumsum(later) - later, later)
+        if len(p) == 0:
+            continue
+
+        wedge_keys = (dst[p] << 32) | dst[q]
+        pos = np.minimum(np.searchsorted(keys, wedge_keys), len(keys) - 1)
+        closed = keys[pos] == wedge_keys
+        triangles.append(np.stack((src[p][closed], dst[p][closed], dst[q][closed]), axis=1))
+
+    if not triangles:
+        return np.empty((0, 3), dtype=np.int64)
+    # Back from ranks to node indices, as sorted rows
+    return np.sort(by_rank[np.concatenate(triangles)], axis=1)
+
+
+def _squares(nbrs: List[List[int]], A: Optional[sp.csr_array] = None) -> np.ndarray:
+    """
+    Chordless 4-cycles over node indices as a (K, 4) array of sorted rows.
+    A is the CSR adjacency of nbrs, if the caller has already built it.
+
+    Rather than scanning all V^2 pairs (u, v), walk the length-2 paths u-a-v
+    and group their midpoints by (u, v): O(sum_a deg(a)^2) on sparse graphs.
+    """
+    if HAVE_NUMBA:
+        return _squares_csr(A if A is not None else _csr_adjacency(nbrs))
+
+    n = len(nbrs)
+    adj_sets = [set(row) for row in nbrs]
+
+    # paths2[(u << 32) | v] = common neighbors a of the non-adjacent pair u < v
+    paths2: Dict[int, List[int]] = defaultdict(list)
+    for a in range(n):
+        row = sorted(nbrs[a])
+        for x, u in enumerate(row):
+            Nu = adj_sets[u]
+            u_key = u << 32
+            for v in row[x + 1:]:
+                if v in Nu:
+                    # u-v would be a diagonal chord in any u-a-v-b-u square
+                    continue
+                paths2[u_key | v].append(a)
+
+    squares: List[Tuple[int, int, int, int]] = []
+    for key, mids in paths2.items():
+        if len(mids) < 2:
+            continue
+        u, v = key >> 32, key & _KEY_MASK
+        # Each pair of common neighbors defines a candidate square; mids is
+        # filled in ascending a, so pairs come out with a < b and no sort.
+        # A square is reached from both of its diagonals (u, v) and (a, b):
+        # only emit it from the one holding its smallest node, i.e. u < a.
+        for x, a in enumerate(mids):
+            if a < u:
                 continue
-            Nv = set(G.neighbors(v))
-            common = Nu & Nv
-            for w in common:
-                if w <= v:
+            Na = adj_sets[a]
+            for b in mids[x + 1:]:
+                if b in Na:
+                    # a-b would be the other diagonal chord
                     continue
-                triangles.add(frozenset((u, v, w)))
-    return sorted(triangles, key=lambda s: tuple(sorted(s)))
+                squares.append((u, v, a, b))
+
+    # Sort each row once, vectorized, instead of per emitted square
+    return np.sort(np.array(squares, dtype=np.int64).reshape(-1, 4), axis=1)
+
+
+def _squares_csr(A: sp.csr_array) -> np.ndarray:
+    """_squares via the parallel Numba kernel, on the CSR adjacency A."""
+    # Rooted at each square's smallest node, so no dedup is needed
+    A = A.sorted_indices()
+    return squares_kernel(
+        A.indptr.astype(np.int64),
+        A.indices.astype(np.int64),
+        4 * get_num_threads(),
+    )
+
+
+def _label_array(nodes: List[Hashable]) -> np.ndarray:
+    """nodes as an array, so index cycles map to labels by fancy indexing."""
+    if not nodes:
+        return np.empty(0, dtype=np.int64)
+    try:
+        labels = np.asarray(nodes)
+    except ValueError:  # ragged labels, e.g. tuples mixed with scalars
+        pass
+    else:
+        if labels.ndim == 1 and labels.dtype.kind in "iu":
+            return labels
+    # Tuples, strings or mixed labels: keep the original objects
+    return np.fromiter(nodes, dtype=object, count=len(nodes))
+
+
+def _sorted_rows(cycles: np.ndarray) -> np.ndarray:
+    """cycles with each row sorted and the rows in lexicographic order."""
+    rows = np.sort(cycles, axis=1)
+    return rows[np.lexsort(rows.T[::-1])]
+
+
+def _to_labels(cycles: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Map an index cycle array to node labels, sorted by label within and
+    across rows. Unorderable labels keep the internal index order.
+    """
+    if labels.dtype != object:
+        return _sorted_rows(labels[cycles])
+    try:
+        by_label = sorted(range(len(labels)), key=labels.__getitem__)
+    except TypeError:
+        return labels[_sorted_rows(cycles)]
+    # Sort in rank space, then map ranks to the label-sorted nodes
+    rank = np.empty(len(labels), dtype=np.int64)
+    rank[by_label] = np.arange(len(labels))
+    return labels[by_label][_sorted_rows(rank[cycles])]
+
+
+def find_chordless_triangles(G: nx.Graph) -> np.ndarray:
+    """
+    All 3-cycles are chordless by definition.
+    Returns unique triangles as a (K, 3) array of node labels.
+    """
+    nodes, _, nbrs = _index_graph(G)
+    return _to_labels(_triangles(nbrs), _label_array(nodes))
 
 
-def find_chordless_4cycles(G: nx.Graph) -> List[FrozenSet[int]]:
+def find_chordless_4cycles(G: nx.Graph) -> np.ndarray:
     """
     Enumerate chordless 4-cycles (squares) using the 'two common neighbors' trick.
 
@@ -54,81 +277,160 @@ def find_chordless_4cycles(G: nx.Graph) -> List[FrozenSet[int]]:
       - u-v is NOT an edge (otherwise u-v would be a chord/diagonal)
       - a-b is NOT an edge (otherwise a-b would be a chord/diagonal)
 
-    Returns unique 4-cycles as frozensets of 4 nodes.
+    Returns unique 4-cycles as a (K, 4) array of node labels.
     """
-    nodes = list(G.nodes())
-    squares: set[FrozenSet[int]] = set()
-
-    # Iterate over unordered pairs (u, v)
-    for i in range(len(nodes)):
-        u = nodes[i]
-        Nu = set(G.neighbors(u))
-        for j in range(i + 1, len(nodes)):
-            v = nodes[j]
-            if G.has_edge(u, v):
-                # u-v would be a diagonal chord in any u-a-v-b-u square
-                continue
+    nodes, _, nbrs = _index_graph(G)
+    return _to_labels(_squares(nbrs), _label_array(nodes))
 
-            common = Nu & set(G.neighbors(v))
-            if len(common) < 2:
-                continue
 
-            # Each pair of common neighbors defines a candidate square
-            for a, b in combinations(sorted(common), 2):
-                if a == b:
-                    continue
-                if G.has_edge(a, b):
-                    # a-b would be the other diagonal chord
-                    continue
-                squares.add(frozenset((u, v, a, b)))
+def _node_counts(cycles: Iterable[np.ndarray], n: int) -> np.ndarray:
+    """c_ii for every node: one bincount over the flattened cycle arrays."""
+    c_ii = np.zeros(n, dtype=np.int64)
+    for cyc in cycles:
+        c_ii += np.bincount(cyc.ravel(), minlength=n)
+    return c_ii
+
 
-    return sorted(squares, key=lambda s: tuple(sorted(s)))
+def _pair_counts(cycles: Iterable[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    c_ij for every pair that shares a cycle, as (keys, counts) arrays.
+    keys are sorted (i << 32) | j values with i < j; rows must be sorted so each column
+    pair (a, b) with a < b already has its smaller node first.
+    """
+    keys = [
+        (cyc[:, a] << 32) | cyc[:, b]
+        for cyc in cycles
+        for a, b in combinations(range(cyc.shape[1]), 2)
+    ]
+    if not keys:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(keys), return_counts=True)
+
+
+def _rows_from_pairs(keys: np.ndarray, counts: np.ndarray, n: int) -> List[Dict[int, int]]:
+    """Symmetric per-node c_ij rows from packed (keys, counts)."""
+    c_ij_row: List[Dict[int, int]] = [{} for _ in range(n)]
+    for key, c in zip(keys.tolist(), counts.tolist()):
+        u, v = key >> 32, key & _KEY_MASK
+        c_ij_row[u][v] = c
+        c_ij_row[v][u] = c
+    return c_ij_row
 
 
 def build_cycle_counts(
-    cycles: Iterable[FrozenSet[int]],
-) -> Tuple[Dict[int, int], Dict[Pair, int]]:
+    cycles: Iterable[np.ndarray],
+    n: int,
+) -> Tuple[np.ndarray, List[Dict[int, int]]]:
+    """
+    Given cycle arrays of node indices in [0, n) (one (K, L) array per cycle
+    length, rows sorted), compute:
+      c_ii: how many cycles contain node i (array of length n)
+      c_ij_row: c_ij_row[i][j] is how many cycles contain both i and j,
+                stored under both i and j so lookups need no pair ordering
     """
-    Given cycles as node-sets, compute:
-      c_ii: how many cycles contain node i
-      c_ij: how many cycles contain both i and j (unordered pair)
+    cycles = list(cycles)
+    keys, counts = _pair_counts(cycles)
+    return _node_counts(cycles, n), _rows_from_pairs(keys, counts, n)
+
+
+def _flat_c_ij(keys: np.ndarray, counts: np.ndarray, nodes: Sequence[Hashable]) -> Dict[Pair, int]:
+    """Packed (keys, counts) as the label-pair dict exposed on CRimpResult."""
+    return {
+        _pair(nodes[key >> 32], nodes[key & _KEY_MASK]): c
+        for key, c in zip(keys.tolist(), counts.tolist())
+    }
+
+
+def _edge_cij(indptr: np.ndarray, indices: np.ndarray, keys: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """c_ij for every CSR entry (i, indices[p]), looked up in the sorted keys."""
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    lo = np.minimum(rows, indices)
+    hi = np.maximum(rows, indices)
+    edge_keys = (lo << 32) | hi
+    if len(keys) == 0:
+        return np.zeros(len(edge_keys), dtype=np.int64)
+    pos = np.minimum(np.searchsorted(keys, edge_keys), len(keys) - 1)
+    return np.where(keys[pos] == edge_keys, counts[pos], 0)
+
+
+def _cycle_neighbor_terms(
+    i: int,
+    nbrs: List[List[int]],
+    c_ii: Optional[np.ndarray],
+    c_ij_row: List[Dict[int, int]],
+    self_term: float = 0.0,
+) -> Tuple[int, float]:
+    """
+    One scan of N(i): returns (#{j in N(i) : c_ij > 0}, s) where
+    s = self_term + sum_{j in N(i), c_ij>0} c_ij/c_jj. With c_ii=None only
+    the count is taken and s stays self_term.
+    """
+    row = c_ij_row[i]
+    cycle_neighbors = 0
+    s = self_term
+    for j in nbrs[i]:
+        cij = row.get(j, 0)
+        if cij > 0:
+            cycle_neighbors += 1
+            if c_ii is not None:
+                s += cij / c_ii[j]
+    return cycle_neighbors, s
+
+
+def compute_kt_and_scores(
+    nbrs: List[List[int]],
+    deg: np.ndarray,
+    c_ii: np.ndarray,
+    c_ij_row: List[Dict[int, int]],
+    include_self: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    c_ii: Dict[int, int] = {}
-    c_ij: Dict[Pair, int] = {}
+    k_t and Eq.(4) in a single pass over each node's neighbors:
+      k_{i,t} = deg(i) - #{j in N(i) : c_ij > 0}
+      r_imp   = [c_ii > 0] + sum_{j in N(i), c_ij>0} c_ij/c_jj + k_t
+
+    A node in no cycle shares no cycle with any neighbor, so this reduces to
+    r_imp = k_t = deg(i) when c_ii == 0. Those nodes are filled in one
+    vectorized step; the neighbor loop only visits nodes with c_ii > 0.
+    include_self=True adds the j=i term (1).
+    """
+    k_t = np.array(deg, dtype=np.int64)
+    r = k_t.astype(np.float64)
 
-    for cyc in cycles:
-        nodes = sorted(cyc)
-        for i in nodes:
-            c_ii[i] = c_ii.get(i, 0) + 1
-        for u, v in combinations(nodes, 2):
-            key = _pair(u, v)
-            c_ij[key] = c_ij.get(key, 0) + 1
+    self_term = 1.0 if include_self else 0.0  # c_ii/c_ii
+    for i in np.flatnonzero(c_ii).tolist():
+        cycle_neighbors, s = _cycle_neighbor_terms(i, nbrs, c_ii, c_ij_row, self_term)
+        k_t_i = deg[i] - cycle_neighbors
+        k_t[i] = k_t_i
+        r[i] = s + float(k_t_i)
 
-    return c_ii, c_ij
+    return k_t, r
 
 
-def compute_k_t(G: nx.Graph, c_ij: Dict[Pair, int]) -> Dict[int, int]:
+def compute_k_t(
+    nbrs: List[List[int]],
+    deg: np.ndarray,
+    c_ij_row: List[Dict[int, int]],
+) -> np.ndarray:
     """
     k_{i,t}: number of neighbors of i that share NO cycle with i.
     i.e. neighbors j where c_ij == 0.
+    nbrs/deg are the per-node neighbor lists and degrees, built once in crimp().
     """
-    k_t: Dict[int, int] = {}
-    for i in G.nodes():
-        cycle_neighbors = 0
-        for j in G.neighbors(i):
-            if c_ij.get(_pair(i, j), 0) > 0:
-                cycle_neighbors += 1
-        k_t[i] = G.degree(i) - cycle_neighbors
+    k_t = np.array(deg, dtype=np.int64)
+    for i in range(len(nbrs)):
+        if c_ij_row[i]:
+            k_t[i] -= _cycle_neighbor_terms(i, nbrs, None, c_ij_row)[0]
     return k_t
 
 
 def compute_crimp_scores(
-    G: nx.Graph,
-    c_ii: Dict[int, int],
-    c_ij: Dict[Pair, int],
-    k_t: Dict[int, int],
+    nbrs: List[List[int]],
+    c_ii: np.ndarray,
+    c_ij_row: List[Dict[int, int]],
+    k_t: np.ndarray,
     include_self: bool = True,
-) -> Dict[int, float]:
+) -> np.ndarray:
     """
     Implements Eq.(4) in a practical way:
       If c_ii == 0: r_imp = k_t
@@ -136,53 +438,120 @@ def compute_crimp_scores(
 
     include_self=True adds the j=i term (which contributes c_ii/c_ii = 1).
     """
-    r: Dict[int, float] = {}
+    r = np.array(k_t, dtype=np.float64)
+    self_term = 1.0 if include_self else 0.0  # c_ii/c_ii
+    for i in np.flatnonzero(c_ii).tolist():
+        _, s = _cycle_neighbor_terms(i, nbrs, c_ii, c_ij_row, self_term)
+        r[i] = s + float(k_t[i])
+    return r
 
-    for i in G.nodes():
-        if c_ii.get(i, 0) == 0:
-            r[i] = float(k_t.get(i, 0))
-            continue
 
-        s = 0.0
+def _crimp_generic(G: nx.Graph) -> CRimpResult:
+    """crimp() for any hashable node labels, via relabeling to [0, n)."""
+    nodes, _, nbrs = _index_graph(G)
+    n = len(nodes)
+    # G.degree counts a self-loop twice, unlike len(nbrs[i])
+    deg = np.fromiter((d for _, d in G.degree()), dtype=np.int64, count=n)
+
+    # Build the CSR adjacency once and share it between all passes; the
+    # pure-Python path on small graphs never reads it
+    A = _csr_adjacency(nbrs) if HAVE_NUMBA or n >= _SPARSE_MIN_NODES else None
+    tris = _triangles(nbrs, A)
+    squares = _squares(nbrs, A)
+
+    c_ii = _node_counts((tris, squares), n)
+    keys, counts = _pair_counts((tris, squares))
+
+    if HAVE_NUMBA:
+        indptr = A.indptr.astype(np.int64)
+        indices = A.indices.astype(np.int64)
+        cij = _edge_cij(indptr, indices, keys, counts)
+        k_t, r_imp = kt_and_scores_kernel(indptr, indices, deg, c_ii, cij, True)
+    else:
+        c_ij_row = _rows_from_pairs(keys, counts, n)
+        k_t, r_imp = compute_kt_and_scores(nbrs, deg, c_ii, c_ij_row, include_self=True)
+
+    # Map indexed results back to the original node labels
+    labels = _label_array(nodes)
+    return CRimpResult(
+        c_ii={nodes[i]: int(c_ii[i]) for i in np.flatnonzero(c_ii)},
+        c_ij=_flat_c_ij(keys, counts, nodes),
+        k_t={nodes[i]: int(k_t[i]) for i in range(n)},
+        r_imp={nodes[i]: float(r_imp[i]) for i in range(n)},
+        cycles3=_to_labels(tris, labels),
+        cycles4=_to_labels(squares, labels),
+    )
 
-        # Optionally include self-term
-        if include_self:
-            s += 1.0  # c_ii/c_ii
 
-        for j in G.neighbors(i):
-            cij = c_ij.get(_pair(i, j), 0)
-            if cij <= 0:
-                continue
-            cjj = c_ii.get(j, 0)
-            if cjj and cjj > 0:
-                s += cij / cjj
+# Int labels below this are used directly as row indices by _crimp_fast
+_FAST_MAX_LABEL = 200_000
 
-        r[i] = s + float(k_t.get(i, 0))
 
-    return r
+def _has_small_int_labels(G: nx.Graph) -> bool:
+    """True when every node is a non-negative int below _FAST_MAX_LABEL."""
+    return all(
+        type(v) is int and 0 <= v < _FAST_MAX_LABEL
+        for v in G.nodes()
+    )
 
 
-def crimp(G: nx.Graph) -> CRimpResult:
+def _crimp_fast(G: nx.Graph) -> CRimpResult:
     """
-    End-to-end: find chordless 3- & 4-cycles, compute counts and CRimp score.
-    """
-    if G.is_directed():
-        raise ValueError("This implementation expects an undirected graph.")
+    crimp() specialized for simple graphs whose nodes are small ints: the
+    labels are the CSR row indices, so there is no relabel dict and the
+    adjacency is read straight out of G. Requires numba.
 
-    cycles3 = find_chordless_triangles(G)
-    cycles4 = find_chordless_4cycles(G)
+    Rows keep G's neighbor order so scores are bit-identical to
+    _crimp_generic; unused labels below max(G) are just empty rows.
+    """
+    labels = np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())
+    n = int(labels.max()) + 1 if len(labels) else 0
+    order = np.sort(labels)
+
+    adj = G._adj
+    lengths = np.zeros(n, dtype=np.int64)
+    lengths[labels] = np.fromiter(map(len, adj.values()), dtype=np.int64, count=len(labels))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    indices = np.fromiter(
+        chain.from_iterable(adj[v] for v in order.tolist()),
+        dtype=np.int64,
+        count=indptr[-1],
+    )
+    deg = lengths.copy()
+    deg[np.fromiter(nx.nodes_with_selfloops(G), dtype=np.int64)] += 1
 
-    all_cycles = list(cycles3) + list(cycles4)
+    A = sp.csr_array((np.ones(len(indices), dtype=np.int32), indices, indptr), shape=(n, n))
+    tris = _triangles_csr(A)
+    squares = _squares_csr(A)
 
-    c_ii, c_ij = build_cycle_counts(all_cycles)
-    k_t = compute_k_t(G, c_ij)
-    r_imp = compute_crimp_scores(G, c_ii, c_ij, k_t, include_self=True)
+    c_ii = _node_counts((tris, squares), n)
+    keys, counts = _pair_counts((tris, squares))
+    cij = _edge_cij(indptr, indices, keys, counts)
+    k_t, r_imp = kt_and_scores_kernel(indptr, indices, deg, c_ii, cij, True)
 
+    nodes = labels.tolist()
     return CRimpResult(
-        c_ii=c_ii,
-        c_ij=c_ij,
-        k_t=k_t,
-        r_imp=r_imp,
-        cycles3=cycles3,
-        cycles4=cycles4,
+        c_ii={i: int(c_ii[i]) for i in nodes if c_ii[i]},
+        c_ij=_flat_c_ij(keys, counts, range(n)),
+        k_t=dict(zip(nodes, k_t[labels].tolist())),
+        r_imp=dict(zip(nodes, r_imp[labels].tolist())),
+        cycles3=_to_labels(tris, np.arange(n)),
+        cycles4=_to_labels(squares, np.arange(n)),
     )
+
+
+def crimp(G: nx.Graph) -> CRimpResult:
+    """
+    End-to-end: find chordless 3- & 4-cycles, compute counts and CRimp score.
+
+    Simple graphs labeled with small non-negative ints take the specialized
+    _crimp_fast path when numba is available; everything else goes through
+    _crimp_generic, which also serves as the reference implementation.
+    """
+    if G.is_directed():
+        raise ValueError("This implementation expects an undirected graph.")
+
+    if HAVE_NUMBA and not G.is_multigraph() and _has_small_int_labels(G):
+        return _crimp_fast(G)
+    return _crimp_generic(G)
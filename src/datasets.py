@@ -2,14 +2,42 @@ from __future__ import annotations
 
 from pathlib import Path
 import networkx as nx
+import numpy as np
+import pandas as pd
 
 # Project root = parent of the src directory
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
+def _int_edge(a: str, b: str) -> tuple:
+    """(int(a), int(b)) if both labels are integers, else (a, b) unchanged."""
+    try:
+        return int(a), int(b)
+    except ValueError:
+        return a, b
+
+def _read_edges_by_line(path: Path) -> list:
+    """
+    Line-by-line parse for files the bulk reader can't take as int64:
+    skips blank and '#' lines and converts each line's labels on its own.
+    """
+    edges = []
+    with path.open("r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split()
+            if len(fields) < 2:
+                raise ValueError(f"{path}:{lineno}: expected two labels, got {line!r}")
+            edges.append(_int_edge(fields[0], fields[1]))
+    return edges
+
 def load_edgelist_txt(path: str | Path, directed: bool = False) -> nx.Graph:
     """
     Load a whitespace-separated edge list (u v) from a .txt file.
     Accepts relative paths resolved against PROJECT_ROOT.
+    Lines starting with '#' are skipped; a line with fewer than two labels
+    raises ValueError.
     """
     path = Path(path)
     if not path.is_absolute():
@@ -17,18 +45,26 @@ def load_edgelist_txt(path: str | Path, directed: bool = False) -> nx.Graph:
 
     G = nx.DiGraph() if directed else nx.Graph()
 
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            a, b = line.split()[:2]
-            try:
-                a = int(a); b = int(b)
-            except ValueError:
-                pass
-            G.add_edge(a, b)
+    # Bulk-parse with pandas' C reader instead of splitting lines in Python.
+    # Comment, short or non-integer lines all keep a column off int64.
+    try:
+        df = pd.read_csv(
+            path,
+            sep=r"\s+",
+            header=None,
+            names=[0, 1],
+            usecols=[0, 1],
+            engine="c",
+        )
+    except pd.errors.ParserError:  # e.g. no line has two fields
+        df = None
+
+    if df is not None and not df.empty and all(pd.api.types.is_integer_dtype(t) for t in df.dtypes):
+        edges = df.to_numpy(dtype=np.int64).tolist()
+    else:
+        edges = _read_edges_by_line(path)
 
+    G.add_edges_from(edges)
     return G
 
 DATASETS = {